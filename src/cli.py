@@ -1,16 +1,20 @@
 """CLI entrypoint: soc-watch."""
 
 import argparse
+import functools
+import logging
+import sys
 
-from dotenv import load_dotenv
+# Heavy imports (dotenv, config, runner -> requests/bs4) are deferred into
+# main() so that `soc-watch --help` stays fast.
 
-load_dotenv()
 
-import logging
-import sys
+@functools.cache
+def _ensure_dotenv() -> bool:
+    """Load .env into os.environ once per process."""
+    from dotenv import load_dotenv
 
-from .config import AvailabilityRule, load_config
-from .runner import run_loop
+    return load_dotenv()
 
 
 def main() -> None:
@@ -18,21 +22,31 @@ def main() -> None:
         prog="soc-watch",
         description="UCLA SOC Availability Watcher - monitor course pages for seat openings",
     )
-    parser.add_argument("--url", help="SOC results URL to monitor")
+    parser.add_argument(
+        "--url",
+        action="append",
+        help="SOC results URL to monitor (repeat to watch several; fetched concurrently)",
+    )
     parser.add_argument(
         "--interval",
         type=int,
         default=60,
         help="Poll interval in seconds (default: 60)",
     )
+    parser.add_argument(
+        "--max-interval",
+        type=int,
+        help="Max poll interval in seconds when backing off on an unchanged page (default: no backoff)",
+    )
     parser.add_argument(
         "--rule",
+        # Mirrors AvailabilityRule; inlined to avoid importing config for --help
         choices=[
-            AvailabilityRule.ANY_OPEN,
-            AvailabilityRule.LECTURE_AND_DISCUSSION,
-            AvailabilityRule.SPECIFIC_SECTIONS,
+            "any_open",
+            "lecture_and_discussion",
+            "specific_sections",
         ],
-        default=AvailabilityRule.ANY_OPEN,
+        default="any_open",
         help="Availability rule (default: any_open)",
     )
     parser.add_argument(
@@ -50,6 +64,12 @@ def main() -> None:
         action="store_true",
         help="Verbose logging",
     )
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Don't print the per-poll status line (events are still shown)",
+    )
     parser.add_argument(
         "--slack-webhook",
         help="Slack Incoming Webhook URL for notifications on availability changes",
@@ -73,17 +93,24 @@ def main() -> None:
     )
 
     args = parser.parse_args()
+
+    _ensure_dotenv()
+
+    from .config import load_config
+
     sections = [s.strip() for s in args.sections.split(",")] if args.sections else None
 
     if args.verbose:
         logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
     config = load_config(
-        url=args.url,
+        urls=args.url,
         interval=args.interval,
+        max_interval=args.max_interval,
         sections=sections,
         rule=args.rule,
         verbose=args.verbose,
+        quiet=args.quiet,
         slack_webhook=args.slack_webhook,
         slack_bot_token=args.slack_bot_token,
         slack_dm_user_id=args.slack_dm_user,
@@ -91,6 +118,8 @@ def main() -> None:
         slack_test=args.slack_test,
     )
 
+    from .runner import run_loop
+
     try:
         run_loop(config, once=args.once)
     except KeyboardInterrupt:
@@ -1,9 +1,11 @@
 """Configuration: env vars, defaults, URL, interval, sections, rule."""
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
+_TRUTHY = frozenset(("1", "true", "yes"))
+
 
 class AvailabilityRule:
     """Availability rule names."""
@@ -17,7 +19,7 @@ class AvailabilityRule:
 class Config:
     """Application configuration."""
 
-    url: str
+    url: str  # primary URL (first of urls)
     interval_sec: int = 60
     watched_sections: Optional[list[str]] = None
     rule: str = AvailabilityRule.ANY_OPEN
@@ -27,6 +29,14 @@ class Config:
     slack_dm_user_id: Optional[str] = None
     slack_channel: Optional[str] = None
     slack_test: bool = False
+    max_interval_sec: Optional[int] = None  # backoff cap; None -> no backoff
+    quiet: bool = False
+    urls: list[str] = field(default_factory=list)  # all watched URLs
+
+    def __post_init__(self) -> None:
+        """Default urls to [url]."""
+        if not self.urls and self.url:
+            self.urls = [self.url]
 
 
 def load_config(
@@ -40,19 +50,28 @@ def load_config(
     slack_dm_user_id: Optional[str] = None,
     slack_channel: Optional[str] = None,
     slack_test: bool = False,
+    max_interval: Optional[int] = None,
+    quiet: bool = False,
+    urls: Optional[list[str]] = None,
 ) -> Config:
     """Load config from env vars with overrides from CLI."""
+    _get = os.environ.get
+    # SOC_URL may hold several whitespace-separated URLs
+    urls = urls or ([url] if url else _get("SOC_URL", "").split())
     return Config(
-        url=url or os.environ.get("SOC_URL", ""),
-        interval_sec=interval or int(os.environ.get("SOC_INTERVAL_SEC", "60")),
-        watched_sections=sections or _parse_sections(os.environ.get("SOC_SECTIONS", "")),
-        rule=rule or os.environ.get("SOC_RULE", AvailabilityRule.ANY_OPEN),
-        verbose=verbose or os.environ.get("SOC_VERBOSE", "").lower() in ("1", "true", "yes"),
-        slack_webhook_url=slack_webhook or os.environ.get("SOC_SLACK_WEBHOOK") or None,
-        slack_bot_token=slack_bot_token or os.environ.get("SOC_SLACK_BOT_TOKEN") or None,
-        slack_dm_user_id=slack_dm_user_id or os.environ.get("SOC_SLACK_DM_USER_ID") or None,
-        slack_channel=slack_channel or os.environ.get("SOC_SLACK_CHANNEL") or None,
-        slack_test=slack_test or os.environ.get("SOC_SLACK_TEST", "").lower() in ("1", "true", "yes"),
+        url=urls[0] if urls else "",
+        urls=urls,
+        interval_sec=interval or int(_get("SOC_INTERVAL_SEC", "60")),
+        max_interval_sec=max_interval or _parse_int(_get("SOC_MAX_INTERVAL_SEC", "")),
+        watched_sections=sections or _parse_sections(_get("SOC_SECTIONS", "")),
+        rule=rule or _get("SOC_RULE", AvailabilityRule.ANY_OPEN),
+        verbose=verbose or _get("SOC_VERBOSE", "").lower() in _TRUTHY,
+        quiet=quiet or _get("SOC_QUIET", "").lower() in _TRUTHY,
+        slack_webhook_url=slack_webhook or _get("SOC_SLACK_WEBHOOK") or None,
+        slack_bot_token=slack_bot_token or _get("SOC_SLACK_BOT_TOKEN") or None,
+        slack_dm_user_id=slack_dm_user_id or _get("SOC_SLACK_DM_USER_ID") or None,
+        slack_channel=slack_channel or _get("SOC_SLACK_CHANNEL") or None,
+        slack_test=slack_test or _get("SOC_SLACK_TEST", "").lower() in _TRUTHY,
     )
 
 
@@ -61,3 +80,8 @@ def _parse_sections(s: str) -> Optional[list[str]]:
     if not s or not s.strip():
         return None
     return [x.strip() for x in s.split(",") if x.strip()]
+
+
+def _parse_int(s: str) -> Optional[int]:
+    """Parse an optional integer env var."""
+    return int(s) if s.strip() else None
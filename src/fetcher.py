@@ -1,10 +1,13 @@
 """HTTP fetcher with retry/backoff for UCLA SOC pages."""
 
+import hashlib
 import logging
 import time
-from typing import Optional
+from enum import Enum
+from typing import Literal, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -15,34 +18,91 @@ DEFAULT_TIMEOUT = 30
 MAX_RETRIES = 3
 RETRY_BACKOFF = 2.0
 
+# Shared session so keep-alive reuses the TCP/TLS connection across polls.
+# Retries are handled in fetch_html, so the adapter does not retry.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": DEFAULT_USER_AGENT,
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+})
+_ADAPTER = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
 
-def fetch_html(url: str) -> Optional[str]:
+
+class _Sentinel(Enum):
+    """Typed sentinel values returned in place of a response body."""
+
+    NOT_MODIFIED = "NOT_MODIFIED"
+
+
+# Returned by fetch_html in place of the HTML when the server answers 304
+NOT_MODIFIED = _Sentinel.NOT_MODIFIED
+# (body or NOT_MODIFIED or None, blake2b digest of the body)
+FetchResult = tuple[Union[bytes, Literal[_Sentinel.NOT_MODIFIED], None], Optional[bytes]]
+
+# Per-URL conditional request headers (If-None-Match / If-Modified-Since)
+_validators: dict[str, dict[str, str]] = {}
+
+
+def fetch_html(url: str, conditional: bool = False) -> FetchResult:
     """
     Fetch HTML from URL with retry/backoff for 429/5xx.
-    Returns None on failure.
+    Returns (html, digest): the raw response body (parse() decodes it) and a
+    blake2b hash of it, so callers can skip parsing unchanged pages.
+    Returns (None, None) on failure.
+    If conditional, sends the ETag/Last-Modified validators from the previous
+    response and returns (NOT_MODIFIED, None) when the server replies 304.
+    Only pass conditional when the caller holds a snapshot of the last body.
     """
-    session = requests.Session()
-    session.headers["User-Agent"] = DEFAULT_USER_AGENT
-
+    headers = _validators.get(url) if conditional else None
     for attempt in range(MAX_RETRIES):
         try:
-            resp = session.get(url, timeout=DEFAULT_TIMEOUT)
+            resp = _SESSION.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+            if resp.status_code == 304:
+                if conditional:
+                    return NOT_MODIFIED, None
+                logger.error("Unexpected 304 for unconditional request: %s", url)
+                return None, None
             if resp.status_code == 429:
                 retry_after = int(resp.headers.get("Retry-After", RETRY_BACKOFF))
-                logger.warning("Rate limited (429), retrying after %s sec", retry_after)
+                logger.warning("Rate limited (429), retrying after %s sec: %s", retry_after, url)
                 time.sleep(retry_after)
                 continue
             if resp.status_code >= 500:
-                logger.warning("Server error %s, attempt %s/%s", resp.status_code, attempt + 1, MAX_RETRIES)
+                logger.warning("Server error %s, attempt %s/%s: %s", resp.status_code, attempt + 1, MAX_RETRIES, url)
                 time.sleep(RETRY_BACKOFF ** attempt)
                 continue
             resp.raise_for_status()
-            return resp.text
+            _remember_validators(url, resp)
+            body = resp.content
+            return body, hashlib.blake2b(body, digest_size=16).digest()
         except requests.RequestException as e:
-            logger.warning("Fetch failed (attempt %s/%s): %s", attempt + 1, MAX_RETRIES, e)
+            logger.warning("Fetch failed (attempt %s/%s) for %s: %s", attempt + 1, MAX_RETRIES, url, e)
             if attempt < MAX_RETRIES - 1:
                 time.sleep(RETRY_BACKOFF ** attempt)
             else:
-                logger.error("Fetch failed after %s attempts", MAX_RETRIES)
-                return None
-    return None
+                logger.error("Fetch failed after %s attempts: %s", MAX_RETRIES, url)
+                return None, None
+    return None, None
+
+
+def close_session() -> None:
+    """Release pooled connections held by the shared session."""
+    _SESSION.close()
+
+
+def _remember_validators(url: str, resp: requests.Response) -> None:
+    """Store ETag/Last-Modified from a 200 response for the next conditional GET."""
+    validators = {}
+    etag = resp.headers.get("ETag")
+    if etag:
+        validators["If-None-Match"] = etag
+    last_modified = resp.headers.get("Last-Modified")
+    if last_modified:
+        validators["If-Modified-Since"] = last_modified
+    if validators:
+        _validators[url] = validators
+    else:
+        _validators.pop(url, None)
@@ -1,5 +1,6 @@
 """Data models for UCLA SOC Availability Watcher."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -16,7 +17,7 @@ class Status(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
-@dataclass
+@dataclass(slots=True)
 class Snapshot:
     """Snapshot of section statuses at a point in time."""
 
@@ -24,6 +25,16 @@ class Snapshot:
     sections: dict[str, str]  # label -> normalized_status
     raw: Optional[dict[str, str]] = None  # label -> raw_text
     meta: Optional[dict[str, str]] = None  # term, course, classid
+    # Derived per-category label indices (not persisted)
+    lec_keys: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    disc_keys: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    open_labels: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index lecture/discussion and OPEN labels once per snapshot."""
+        self.open_labels = frozenset(k for k, v in self.sections.items() if v == Status.OPEN.value)
+        self.lec_keys = tuple(k for k in self.sections if k[:3].lower() == "lec")
+        self.disc_keys = tuple(k for k in self.sections if k[:3].lower() == "dis")
 
     def to_dict(self) -> dict:
         """Serialize for JSON persistence."""
@@ -40,9 +51,10 @@ class Snapshot:
     @classmethod
     def from_dict(cls, d: dict) -> "Snapshot":
         """Deserialize from JSON."""
+        # Intern statuses so they share identity with the parser's Status values
         return cls(
             timestamp=datetime.fromisoformat(d["timestamp"]),
-            sections=d["sections"],
+            sections={k: sys.intern(v) if isinstance(v, str) else v for k, v in d["sections"].items()},
             raw=d.get("raw"),
             meta=d.get("meta"),
         )
@@ -56,7 +68,7 @@ class EventType(str, Enum):
     STATUS_CHANGED = "STATUS_CHANGED"
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Event emitted when availability changes."""
 
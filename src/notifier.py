@@ -1,93 +1,132 @@
-"""Notifiers: ConsoleNotifier, WebhookNotifier, SlackNotifier, SlackBotNotifier. Interface: notify(event)."""
+"""Notifiers: ConsoleNotifier, WebhookNotifier, SlackNotifier, SlackBotNotifier. Interface: notify(event), notify_batch(events), notify_status(snapshot, url)."""
 
+import json
 import logging
+from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 
 import requests
 
-from .models import Event, EventType
+from .models import Event, EventType, Snapshot
 
 logger = logging.getLogger(__name__)
 
+_AVAIL = EventType.BECAME_AVAILABLE
+_UNAVAIL = EventType.BECAME_UNAVAILABLE
+
+
+def _dumps(payload: dict) -> bytes:
+    """Serialize a JSON payload compactly (sessions already set Content-Type)."""
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _format_section_lines(sections: dict[str, str]) -> str:
+    """One indented 'label: status' line per section, each prefixed with a newline."""
+    return "".join(f"\n  {k}: {v}" for k, v in sections.items())
+
+
+def _finish_slack_text(
+    body: str,
+    timestamp: datetime,
+    url: Optional[str] = None,
+    ping_user_id: Optional[str] = None,
+) -> str:
+    """Append the time/URL footer and optional user ping shared by all Slack messages."""
+    text = f"{body}\n  Time: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
+    if url:
+        text += f"\n  URL: <{url}|View SOC>"
+    if ping_user_id:
+        text = f"<@{ping_user_id}> {text}"
+    return text
+
 
 def _format_slack_message(event: Event, ping_user_id: Optional[str] = None) -> str:
     """Build Slack message text for an event (shared by SlackNotifier and SlackBotNotifier)."""
-    lines = []
-    if event.type == EventType.BECAME_AVAILABLE:
-        lines.append("*CLASS AVAILABLE*")
-        for k, v in event.curr_snapshot.sections.items():
-            lines.append(f"  {k}: {v}")
-    elif event.type == EventType.BECAME_UNAVAILABLE:
-        lines.append("*Class no longer available*")
-        lines.append(f"  Sections: {event.curr_snapshot.sections}")
+    sections = event.curr_snapshot.sections
+    if event.type is _AVAIL:
+        body = "*CLASS AVAILABLE*" + _format_section_lines(sections)
+    elif event.type is _UNAVAIL:
+        body = f"*Class no longer available*\n  Sections: {sections}"
     else:
-        lines.append("*Status changed*")
-        lines.append(f"  Changed: {event.diff}")
-        lines.append(f"  Sections: {event.curr_snapshot.sections}")
+        body = f"*Status changed*\n  Changed: {event.diff}\n  Sections: {sections}"
+    return _finish_slack_text(body, event.timestamp, event.url, ping_user_id)
 
-    lines.append(f"  Time: {event.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-    if event.url:
-        lines.append(f"  URL: <{event.url}|View SOC>")
 
-    text = "\n".join(lines)
+def _format_slack_batch(events: list[Event], ping_user_id: Optional[str] = None) -> str:
+    """Build one Slack message covering several events (pinging the user once)."""
+    text = "\n\n".join(_format_slack_message(e) for e in events)
     if ping_user_id:
-        text = f"<@{ping_user_id}> " + text
+        text = f"<@{ping_user_id}> {text}"
     return text
 
 
 def _format_status_check(snapshot, url: Optional[str] = None, ping_user_id: Optional[str] = None) -> str:
     """Format a status-check message for Slack (used with --slack-test)."""
-    parts = [f"  {k}: {v}" for k, v in snapshot.sections.items()]
-    lines = ["*Status check*", *parts, f"  Time: {snapshot.timestamp.strftime('%Y-%m-%d %H:%M:%S')}"]
-    if url:
-        lines.append(f"  URL: <{url}|View SOC>")
-    text = "\n".join(lines)
-    if ping_user_id:
-        text = f"<@{ping_user_id}> " + text
-    return text
+    body = "*Status check*" + _format_section_lines(snapshot.sections)
+    return _finish_slack_text(body, snapshot.timestamp, url, ping_user_id)
+
+
+def _url_suffix(event: Event) -> str:
+    """' (url)' for console lines when the event carries a URL, else ''."""
+    return f" ({event.url})" if event.url else ""
 
 
-class ConsoleNotifier:
+class Notifier(ABC):
+    """Base notifier: notify(event) per event, notify_status(snapshot, url) every poll."""
+
+    @abstractmethod
+    def notify(self, event: Event) -> None:
+        """Deliver an availability event."""
+
+    def notify_batch(self, events: list[Event]) -> None:
+        """Deliver all events from one poll (across every watched URL); the Slack notifiers send one message."""
+        for event in events:
+            self.notify(event)
+
+    def notify_status(self, snapshot: Snapshot, url: Optional[str] = None) -> None:
+        """Deliver the per-poll status check; no-op unless overridden."""
+
+
+class ConsoleNotifier(Notifier):
     """Print events to console."""
 
     def notify(self, event: Event) -> None:
         """Emit event to console."""
-        if event.type == EventType.BECAME_AVAILABLE:
+        if event.type is _AVAIL:
             self._notify_available(event)
-        elif event.type == EventType.BECAME_UNAVAILABLE:
+        elif event.type is _UNAVAIL:
             self._notify_unavailable(event)
         else:
             self._notify_status_changed(event)
 
     def _notify_available(self, event: Event) -> None:
-        lines = [
-            "",
-            "🎉 CLASS AVAILABLE",
-            *[f"  {k}: {v}" for k, v in event.curr_snapshot.sections.items()],
-            f"  Time: {event.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
-        ]
+        sections = _format_section_lines(event.curr_snapshot.sections)
+        text = f"\n🎉 CLASS AVAILABLE{sections}\n  Time: {event.timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
         if event.url:
-            lines.append(f"  URL: {event.url}")
-        print("\n".join(lines))
+            text += f"\n  URL: {event.url}"
+        print(text)
 
     def _notify_unavailable(self, event: Event) -> None:
-        print(f"\n⚠️ Class no longer available. Sections: {event.curr_snapshot.sections}")
+        print(f"\n⚠️ Class no longer available. Sections: {event.curr_snapshot.sections}{_url_suffix(event)}")
 
     def _notify_status_changed(self, event: Event) -> None:
-        print(f"\n📋 Status changed: {event.diff} -> {event.curr_snapshot.sections}")
+        print(f"\n📋 Status changed: {event.diff} -> {event.curr_snapshot.sections}{_url_suffix(event)}")
 
 
-class WebhookNotifier:
+class WebhookNotifier(Notifier):
     """POST event to a webhook URL (Discord, Slack, etc.)."""
 
     def __init__(self, url: str):
         self.url = url
+        self._session = requests.Session()
+        self._session.headers["Content-Type"] = "application/json"
 
     def notify(self, event: Event) -> None:
         """POST event payload to webhook."""
         try:
             payload = self._build_payload(event)
-            requests.post(self.url, json=payload, timeout=10)
+            self._session.post(self.url, data=_dumps(payload), timeout=10)
         except Exception as e:
             logger.error("Webhook notify failed: %s", e)
 
@@ -102,44 +141,42 @@ class WebhookNotifier:
         }
 
 
-class SlackNotifier:
+class SlackNotifier(Notifier):
     """Post events to Slack via Incoming Webhook."""
 
     def __init__(self, webhook_url: str):
         self.webhook_url = webhook_url
+        self._session = requests.Session()
+        self._session.headers["Content-Type"] = "application/json"
 
     def notify(self, event: Event) -> None:
         """Post event to Slack."""
-        try:
-            payload = self._build_payload(event)
-            requests.post(
-                self.webhook_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=10,
-            )
-        except Exception as e:
-            logger.error("Slack notify failed: %s", e)
+        self._post(self._build_payload(event))
+
+    def notify_batch(self, events: list[Event]) -> None:
+        """Post all events from one poll as a single Slack message."""
+        if len(events) <= 1:
+            super().notify_batch(events)
+            return
+        self._post({"text": _format_slack_batch(events)})
 
     def _build_payload(self, event: Event) -> dict:
         """Build Slack Incoming Webhook payload with text field."""
         return {"text": _format_slack_message(event)}
 
-    def notify_status(self, snapshot, url: Optional[str] = None) -> None:
+    def notify_status(self, snapshot: Snapshot, url: Optional[str] = None) -> None:
         """Send status check to Slack (for --slack-test)."""
+        self._post({"text": _format_status_check(snapshot, url)})
+
+    def _post(self, payload: dict) -> None:
+        """POST payload to the webhook; errors are logged, not raised."""
         try:
-            payload = {"text": _format_status_check(snapshot, url)}
-            requests.post(
-                self.webhook_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=10,
-            )
+            self._session.post(self.webhook_url, data=_dumps(payload), timeout=10)
         except Exception as e:
             logger.error("Slack notify failed: %s", e)
 
 
-class SlackBotNotifier:
+class SlackBotNotifier(Notifier):
     """Post events to Slack via Bot API (channel or DM)."""
 
     def __init__(self, bot_token: str, dm_user_id: str, channel: Optional[str] = None):
@@ -147,6 +184,11 @@ class SlackBotNotifier:
         self.dm_user_id = dm_user_id
         self.channel = channel
         self._dm_channel_id: Optional[str] = None
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": f"Bearer {bot_token}",
+            "Content-Type": "application/json",
+        })
 
     def _get_channel(self) -> Optional[str]:
         """Return channel ID or name for posting."""
@@ -156,40 +198,28 @@ class SlackBotNotifier:
 
     def notify(self, event: Event) -> None:
         """Send message to channel or DM."""
-        try:
-            channel_id = self._get_channel()
-            if not channel_id:
-                return
-            text = _format_slack_message(event, ping_user_id=self.dm_user_id)
-            resp = requests.post(
-                "https://slack.com/api/chat.postMessage",
-                headers={
-                    "Authorization": f"Bearer {self.bot_token}",
-                    "Content-Type": "application/json",
-                },
-                json={"channel": channel_id, "text": text},
-                timeout=10,
-            )
-            data = resp.json()
-            if not data.get("ok"):
-                logger.error("Slack chat.postMessage failed: %s", data.get("error", "unknown"))
-        except Exception as e:
-            logger.error("Slack Bot notify failed: %s", e)
+        self._post_message(_format_slack_message(event, ping_user_id=self.dm_user_id))
 
-    def notify_status(self, snapshot, url: Optional[str] = None) -> None:
+    def notify_batch(self, events: list[Event]) -> None:
+        """Send all events from one poll as a single message."""
+        if len(events) <= 1:
+            super().notify_batch(events)
+            return
+        self._post_message(_format_slack_batch(events, ping_user_id=self.dm_user_id))
+
+    def notify_status(self, snapshot: Snapshot, url: Optional[str] = None) -> None:
         """Send status check to Slack."""
+        self._post_message(_format_status_check(snapshot, url, ping_user_id=self.dm_user_id))
+
+    def _post_message(self, text: str) -> None:
+        """chat.postMessage to the channel or DM; errors are logged, not raised."""
         try:
             channel_id = self._get_channel()
             if not channel_id:
                 return
-            text = _format_status_check(snapshot, url, ping_user_id=self.dm_user_id)
-            resp = requests.post(
+            resp = self._session.post(
                 "https://slack.com/api/chat.postMessage",
-                headers={
-                    "Authorization": f"Bearer {self.bot_token}",
-                    "Content-Type": "application/json",
-                },
-                json={"channel": channel_id, "text": text},
+                data=_dumps({"channel": channel_id, "text": text}),
                 timeout=10,
             )
             data = resp.json()
@@ -204,13 +234,9 @@ class SlackBotNotifier:
             return self._dm_channel_id
 
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 "https://slack.com/api/conversations.open",
-                headers={
-                    "Authorization": f"Bearer {self.bot_token}",
-                    "Content-Type": "application/json",
-                },
-                json={"users": [self.dm_user_id]},
+                data=_dumps({"users": [self.dm_user_id]}),
                 timeout=10,
             )
             data = resp.json()
@@ -3,14 +3,33 @@
 import logging
 import re
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Union
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .models import Snapshot, Status
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used per row
+_DATA_ROW_RE = re.compile(r"data_row")
+_SECTION_LABEL_RE = re.compile(r"(Lec|Dis|Lab|Sem)\s*\d\w*", re.I)
+_SECTION_MATCH_RE = re.compile(r"^(Lec|Dis|Lab|Sem)\s*\d", re.I)
+_CAPACITY_RE = re.compile(r"\s*\([^)]*capacity[^)]*\).*", re.I)
+_STATUS_HTML_RE = re.compile(
+    r"\b(Open|Closed by Dept|Full|Waitlisted|Cancelled|Canceled|Waitlist|Closed)\b",
+    re.I,
+)
+
+# Cheap pre-check: pages with neither marker cannot yield any rows
+_ROW_MARKER_RE = re.compile(r"data_row|<table", re.I)
+_ROW_MARKER_BYTES_RE = re.compile(rb"data_row|<table", re.I)
+
+# Only build the DOM for UCLA SOC data rows; everything else on the page is skipped
+_STRAINER = SoupStrainer("div", class_=_DATA_ROW_RE)
+# Legacy fallback only looks inside tables
+_TABLE_STRAINER = SoupStrainer("table")
+
 # Normalize raw status text to enum
 STATUS_MAP = {
     "open": Status.OPEN,
@@ -22,6 +41,8 @@ STATUS_MAP = {
     "cancelled": Status.CANCELLED,
     "canceled": Status.CANCELLED,
 }
+# Same mapping resolved to the stored status strings, so rows skip the enum lookup
+_STATUS_VALUES = {k: v.value for k, v in STATUS_MAP.items()}
 
 # UCLA SOC status phrases (order matters for regex)
 STATUS_PHRASES = [
@@ -34,21 +55,29 @@ STATUS_PHRASES = [
     "closed",
     "full",
 ]
+_STATUS_PHRASE_RE = re.compile("|".join(re.escape(p) for p in STATUS_PHRASES), re.I)
 
 
-def _normalize(raw_text: str) -> Status:
-    """Map raw status text to normalized Status enum."""
-    key = raw_text.strip().lower()
-    return STATUS_MAP.get(key, Status.UNKNOWN)
+def _normalize_value(raw_text: str) -> str:
+    """Map raw status text straight to its normalized status string."""
+    return _STATUS_VALUES.get(raw_text.strip().lower(), Status.UNKNOWN.value)
 
 
-def parse(html: str) -> Optional[Snapshot]:
+def parse(html: Union[str, bytes], now: Optional[datetime] = None) -> Optional[Snapshot]:
     """
     Parse HTML into Snapshot. Best-effort, defensive.
+    Accepts raw bytes from the fetcher (lxml decodes them) or str.
     Returns None on parse failure; logs errors.
+    now: snapshot timestamp (defaults to the current UTC time).
     """
+    marker_re = _ROW_MARKER_BYTES_RE if isinstance(html, bytes) else _ROW_MARKER_RE
+    if not marker_re.search(html):
+        # Error/maintenance page: skip building a DOM at all
+        logger.warning("No section rows found; SOC HTML structure may have changed")
+        return Snapshot(timestamp=now or datetime.now(timezone.utc), sections={})
+
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml", parse_only=_STRAINER)
     except Exception as e:
         logger.error("Failed to parse HTML: %s", e)
         return None
@@ -59,7 +88,12 @@ def parse(html: str) -> Optional[Snapshot]:
 
     rows = _find_ucla_soc_rows(soup)
     if not rows:
-        # Fallback: try legacy table structure (for fixtures)
+        # Fallback: try legacy table structure (for fixtures); re-parse keeping tables only
+        try:
+            soup = BeautifulSoup(html, "lxml", parse_only=_TABLE_STRAINER)
+        except Exception as e:
+            logger.error("Failed to parse HTML: %s", e)
+            return None
         rows = _find_legacy_table_rows(soup)
 
     if not rows:
@@ -70,11 +104,11 @@ def parse(html: str) -> Optional[Snapshot]:
         if not label or not raw_status:
             label, raw_status = _extract_legacy_row(row)
         if label and raw_status:
-            sections[label] = _normalize(raw_status).value
+            sections[label] = _normalize_value(raw_status)
             raw[label] = raw_status
 
     return Snapshot(
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now or datetime.now(timezone.utc),
         sections=sections,
         raw=raw if raw else None,
         meta=meta,
@@ -84,7 +118,7 @@ def parse(html: str) -> Optional[Snapshot]:
 def _find_ucla_soc_rows(soup: BeautifulSoup) -> list:
     """Find UCLA SOC data rows: div.row-fluid.data_row with sectionColumn."""
     rows = []
-    for row in soup.find_all("div", class_=re.compile(r"data_row")):
+    for row in soup.find_all("div", class_=_DATA_ROW_RE):
         if row.find("div", class_="sectionColumn") and row.find("div", class_="statusColumn"):
             rows.append(row)
     return rows
@@ -107,10 +141,10 @@ def _extract_ucla_row(row) -> tuple[Optional[str], Optional[str]]:
             label = a.get_text(strip=True) or (a.string.strip() if a.string else None)
         if not label:
             text = cls_section.get_text(strip=True) or cls_section.decode_contents()
-            match = re.search(r"(Lec|Dis|Lab|Sem)\s*\d\w*", text, re.I)
+            match = _SECTION_LABEL_RE.search(text)
             label = match.group(0) if match else None
 
-    if not label or not re.match(r"^(Lec|Dis|Lab|Sem)\s*\d", label, re.I):
+    if not label or not _SECTION_MATCH_RE.match(label):
         return None, None
 
     # Status: from statusColumn <p>, extract status phrase
@@ -131,24 +165,15 @@ def _extract_ucla_row(row) -> tuple[Optional[str], Optional[str]]:
 
 def _extract_status_from_text(text: str) -> str:
     """Extract status phrase from status column text (e.g. 'Closed by Dept Computer Science (0 capacity...)')."""
-    # Remove capacity parenthetical
-    text = re.sub(r"\s*\([^)]*capacity[^)]*\).*", "", text, flags=re.I).strip()
-    text_lower = text.lower()
-    for phrase in STATUS_PHRASES:
-        if phrase in text_lower:
-            # Return with original casing from first occurrence
-            idx = text_lower.find(phrase)
-            return text[idx : idx + len(phrase)]
-    return "UNKNOWN"
+    # Remove capacity parenthetical, then return the leftmost phrase with original casing
+    # (STATUS_PHRASES order only breaks ties at the same position)
+    match = _STATUS_PHRASE_RE.search(_CAPACITY_RE.sub("", text))
+    return match.group(0) if match else "UNKNOWN"
 
 
 def _extract_status_from_html(html: str) -> str:
     """Extract status phrase from status column HTML (fallback when get_text is empty)."""
-    match = re.search(
-        r"\b(Open|Closed by Dept|Full|Waitlisted|Cancelled|Canceled|Waitlist|Closed)\b",
-        html,
-        re.I,
-    )
+    match = _STATUS_HTML_RE.search(html)
     return match.group(1) if match else "UNKNOWN"
 
 
@@ -172,6 +197,6 @@ def _extract_legacy_row(row) -> tuple[Optional[str], Optional[str]]:
     status_candidate = cells[-1].get_text(strip=True)
     if status_candidate.isdigit() and len(cells) >= 3:
         status_candidate = cells[-2].get_text(strip=True)
-    if not re.match(r"^(Lec|Dis|Lab|Sem)\s*\d", label_candidate, re.I):
+    if not _SECTION_MATCH_RE.match(label_candidate):
         return None, None
     return label_candidate, status_candidate
@@ -1,90 +1,311 @@
 """Orchestration loop: fetch → parse → detect → notify → persist → sleep."""
 
+import dataclasses
 import logging
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Optional
 
 from .config import Config
 from .detector import detect
-from .fetcher import fetch_html
-from .models import Snapshot
-from .notifier import ConsoleNotifier, SlackBotNotifier, SlackNotifier
+from .fetcher import NOT_MODIFIED, FetchResult, close_session, fetch_html
+from .models import Event, Snapshot
+from .notifier import ConsoleNotifier, Notifier, SlackBotNotifier, SlackNotifier
 from .parser import parse
 from .state import load_last_snapshot, save_snapshot
 
 logger = logging.getLogger(__name__)
 
+# Body hash per URL from the last successful parse, for skipping unchanged pages
+_last_hash: dict[str, bytes] = {}
+# Recently parsed pages by body hash (LRU), so a page flipping back skips parse()
+PARSE_CACHE_SIZE = 4
+_parse_cache: OrderedDict[bytes, Snapshot] = OrderedDict()
+# Consecutive polls per URL that returned an unchanged page (drives the backoff)
+_unchanged_streaks: dict[str, int] = {}
 
-def run_once(config: Config, url: Optional[str] = None) -> bool:
+# State writes run off the poll path on a single worker; latest queued write per state file
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="soc-state")
+_pending_saves: dict[Optional[str], Future] = {}
+# State keys whose last write failed, so the next poll rewrites them even if unchanged
+_dirty_saves: set[Optional[str]] = set()
+
+# With several URLs, all pages are fetched concurrently before processing
+_fetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="soc-fetch")
+
+# Notifiers are independent endpoints, so they are sent to in parallel
+_notify_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="soc-notify")
+
+# Backoff doubles the interval per unchanged poll, up to 2**MAX_BACKOFF_SHIFT
+MAX_BACKOFF_SHIFT = 4
+
+
+def run_once(
+    config: Config,
+    url: Optional[str] = None,
+    prev: Optional[Snapshot] = None,
+    notifiers: Optional[list[Notifier]] = None,
+) -> tuple[bool, Optional[Snapshot]]:
     """
-    Run one poll cycle. Returns True if successful.
+    Run one poll cycle against prev (the last good snapshot, or None).
+    notifiers come from _build_notifiers (built here if omitted).
+    Returns (ok, snapshot): the new snapshot on success, otherwise prev.
     On parse failure: log, do not overwrite last good snapshot.
     """
     target_url = url or config.url
     if not target_url:
         logger.error("No URL configured")
-        return False
+        return False, prev
+    fetched = fetch_html(target_url, conditional=_reusable(target_url, prev))
+    snapshot, events, unchanged = _process(config, target_url, prev, fetched)
+    if snapshot is None:
+        return False, prev
+
+    if notifiers is None:
+        notifiers = _build_notifiers(config)
+    _dispatch_notifications(notifiers, events, [(snapshot, target_url)])
+    _finish(config, target_url, snapshot, unchanged)
+    return True, snapshot
+
+
+def run_all(
+    config: Config,
+    prevs: dict[str, Optional[Snapshot]],
+    notifiers: list[Notifier],
+) -> dict[str, Optional[Snapshot]]:
+    """
+    Poll every URL in config.urls: fetch all pages concurrently, then process
+    each in order. Events from all URLs go to each notifier as one batch.
+    Returns the updated last-good snapshot per URL.
+    """
+    futures = {
+        u: _fetch_pool.submit(fetch_html, u, _reusable(u, prevs.get(u)))
+        for u in config.urls
+    }
+    results = {u: _process(config, u, prevs.get(u), f.result()) for u, f in futures.items()}
+    polled = [(u, r) for u, r in results.items() if r[0] is not None]
+
+    events = [e for _, (_, url_events, _) in polled for e in url_events]
+    _dispatch_notifications(notifiers, events, [(snapshot, u) for u, (snapshot, _, _) in polled])
+    for u, (snapshot, _, unchanged) in polled:
+        _finish(config, u, snapshot, unchanged)
+    return {
+        u: snapshot if snapshot is not None else prevs.get(u)
+        for u, (snapshot, _, _) in results.items()
+    }
 
-    html = fetch_html(target_url)
+
+def _reusable(url: str, prev: Optional[Snapshot]) -> bool:
+    """Whether prev matches a page this process parsed, so a 304 can reuse it."""
+    return prev is not None and url in _last_hash
+
+
+def _process(
+    config: Config,
+    url: str,
+    prev: Optional[Snapshot],
+    fetched: FetchResult,
+) -> tuple[Optional[Snapshot], list[Event], bool]:
+    """
+    Parse → detect for one fetched page.
+    Returns (snapshot, events, unchanged); snapshot is None on failure.
+    """
+    html, body_hash = fetched
     if html is None:
-        logger.error("Fetch failed")
-        return False
+        logger.error("Fetch failed: %s", url)
+        return None, [], False
+    if html is NOT_MODIFIED and not _reusable(url, prev):
+        logger.error("Fetch returned 304 with no snapshot to reuse: %s", url)
+        return None, [], False
+
+    now = datetime.now(timezone.utc)
 
-    snapshot = parse(html)
+    unchanged = _reusable(url, prev) and (html is NOT_MODIFIED or body_hash == _last_hash[url])
+    if unchanged:
+        # Unchanged page: reuse the last snapshot, nothing can have changed
+        _unchanged_streaks[url] = _unchanged_streaks.get(url, 0) + 1
+        return dataclasses.replace(prev, timestamp=now), [], True
+
+    snapshot = _parse_cached(html, body_hash, now)
     if snapshot is None:
-        logger.error("Parse failed; not overwriting last good state")
-        return False
+        logger.error("Parse failed; not overwriting last good state: %s", url)
+        _last_hash.pop(url, None)
+        return None, [], False
+
+    events = detect(prev, snapshot, config, url=url, now=now)
+    if body_hash is not None:
+        _last_hash[url] = body_hash
+    _unchanged_streaks[url] = 0
+    return snapshot, events, False
+
+
+def _finish(config: Config, url: str, snapshot: Snapshot, unchanged: bool) -> None:
+    """Log the status line and persist the snapshot after notifications went out."""
+    # Log status line (to the logger when verbose, else stdout); only built if emitted
+    label_url = url if len(config.urls) > 1 else None
+    if config.verbose:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s", _format_status_line(snapshot, label_url))
+    elif not config.quiet:
+        print(_format_status_line(snapshot, label_url))
+
+    # Unchanged pages only move the timestamp; skip the write unless the last one failed
+    key = _state_key(config, url)
+    if not unchanged or key in _dirty_saves:
+        _save_async(snapshot, key)
 
-    prev = load_last_snapshot()
-    events = detect(prev, snapshot, config, url=target_url)
 
-    notifiers = [ConsoleNotifier()]
-    slack_notifiers = []
+def _state_key(config: Config, url: str) -> Optional[str]:
+    """State file key: None (last.json) for a single URL, else the URL itself."""
+    return url if len(config.urls) > 1 else None
+
+
+def _format_status_line(snapshot: Snapshot, url: Optional[str] = None) -> str:
+    """One-line poll summary: [timestamp] label: status | ... (url, when watching several)."""
+    ts = snapshot.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+    body = " | ".join(f"{k}: {v}" for k, v in snapshot.sections.items())
+    line = f"[{ts}] {body}"
+    return f"{line} ({url})" if url else line
+
+
+def _parse_cached(html: bytes, body_hash: Optional[bytes], now: datetime) -> Optional[Snapshot]:
+    """parse(), memoized by body hash; hits are copies with a fresh timestamp."""
+    if body_hash is None:
+        return parse(html, now=now)
+    cached = _parse_cache.get(body_hash)
+    if cached is not None:
+        _parse_cache.move_to_end(body_hash)
+        return dataclasses.replace(cached, timestamp=now)
+    snapshot = parse(html, now=now)
+    if snapshot is not None:
+        _parse_cache[body_hash] = snapshot
+        if len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return snapshot
+
+
+def _build_notifiers(config: Config) -> list[Notifier]:
+    """Build the notifier list once per run_loop."""
+    notifiers: list[Notifier] = [ConsoleNotifier()]
     if config.slack_webhook_url:
-        n = SlackNotifier(config.slack_webhook_url)
-        notifiers.append(n)
-        slack_notifiers.append(n)
+        notifiers.append(SlackNotifier(config.slack_webhook_url))
     if config.slack_bot_token and config.slack_dm_user_id:
-        n = SlackBotNotifier(
+        notifiers.append(SlackBotNotifier(
             config.slack_bot_token,
             config.slack_dm_user_id,
             channel=config.slack_channel,
-        )
-        notifiers.append(n)
-        slack_notifiers.append(n)
+        ))
+    return notifiers
 
-    for event in events:
-        for notifier in notifiers:
-            notifier.notify(event)
 
-    # Always send status to Slack on every poll (even when closed)
-    if slack_notifiers:
-        for n in slack_notifiers:
-            n.notify_status(snapshot, target_url)
+def _dispatch_notifications(
+    notifiers: list[Notifier],
+    events: list[Event],
+    statuses: list[tuple[Snapshot, str]],
+) -> None:
+    """
+    Send events and the per-poll status of each URL through every notifier concurrently.
+    Each notifier still sees its events in order; returns once all have finished.
+    """
+    if len(notifiers) <= 1:
+        for n in notifiers:
+            _notify_one(n, events, statuses)
+        return
+    futures = [_notify_pool.submit(_notify_one, n, events, statuses) for n in notifiers]
+    for f in futures:
+        f.result()
 
-    # Log status line
-    if config.verbose:
-        parts = [f"{k}: {v}" for k, v in snapshot.sections.items()]
-        logger.info("[%s] %s", snapshot.timestamp.strftime("%Y-%m-%d %H:%M:%S"), " | ".join(parts))
+
+def _notify_one(notifier: Notifier, events: list[Event], statuses: list[tuple[Snapshot, str]]) -> None:
+    """Deliver this poll's events to one notifier as a batch, then its status messages."""
+    if events:
+        notifier.notify_batch(events)
+    # Always send status on every poll (even when closed); no-op for console
+    for snapshot, url in statuses:
+        notifier.notify_status(snapshot, url)
+
+
+def _save_async(snapshot: Snapshot, key: Optional[str] = None) -> None:
+    """Queue a state write, dropping an older write to the same file that has not started yet."""
+    pending = _pending_saves.get(key)
+    if pending is not None:
+        pending.cancel()
+    _pending_saves[key] = _writer.submit(_save_logged, snapshot, key)
+
+
+def _save_logged(snapshot: Snapshot, key: Optional[str]) -> None:
+    """Save on the writer thread; log failures since nobody awaits the result."""
+    try:
+        save_snapshot(snapshot, key)
+    except Exception as e:
+        logger.error("Failed to save state: %s", e)
+        _dirty_saves.add(key)
     else:
-        parts = [f"{k}: {v}" for k, v in snapshot.sections.items()]
-        print(f"[{snapshot.timestamp.strftime('%Y-%m-%d %H:%M:%S')}] {' | '.join(parts)}")
+        _dirty_saves.discard(key)
 
-    save_snapshot(snapshot)
-    return True
+
+def _flush_saves() -> None:
+    """Block until the most recently queued state writes have finished."""
+    for pending in list(_pending_saves.values()):
+        if not pending.cancelled():
+            pending.result()
 
 
 def run_loop(config: Config, once: bool = False) -> None:
     """Main loop: poll at interval until interrupted or --once."""
-    url = config.url
-    if not url:
+    if not config.urls:
         print("Error: --url or SOC_URL required")
         return
 
-    if once:
-        run_once(config, url)
-        return
+    # Only cold read of the state files; afterwards this process is the sole writer
+    prevs = {u: load_last_snapshot(_state_key(config, u)) for u in config.urls}
+    # Built once so Slack sessions (and the DM channel lookup) persist across polls
+    notifiers = _build_notifiers(config)
+    try:
+        if once:
+            _poll(config, prevs, notifiers)
+            return
+
+        # Schedule against monotonic deadlines so poll duration does not add drift
+        deadline = time.monotonic()
+        while True:
+            prevs = _poll(config, prevs, notifiers)
+            deadline += _next_interval(config)
+            sleep_for = deadline - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                # Overran the interval: poll again now and restart the schedule
+                deadline = time.monotonic()
+    finally:
+        _flush_saves()
+        close_session()
 
-    while True:
-        run_once(config, url)
-        time.sleep(config.interval_sec)
+
+def _poll(
+    config: Config,
+    prevs: dict[str, Optional[Snapshot]],
+    notifiers: list[Notifier],
+) -> dict[str, Optional[Snapshot]]:
+    """One cycle over all URLs; a single URL skips the fetch pool."""
+    if len(config.urls) == 1:
+        url = config.urls[0]
+        _, prev = run_once(config, url, prevs[url], notifiers)
+        return {url: prev}
+    return run_all(config, prevs, notifiers)
+
+
+def _next_interval(config: Config) -> int:
+    """
+    Poll interval, backing off exponentially while every page stays unchanged.
+    Backoff is opt-in: without max_interval_sec every poll uses interval_sec.
+    """
+    if not config.max_interval_sec:
+        return config.interval_sec
+    streak = min(_unchanged_streaks.get(u, 0) for u in config.urls)
+    if not streak:
+        return config.interval_sec
+    backoff = config.interval_sec << min(streak, MAX_BACKOFF_SHIFT)
+    return max(config.interval_sec, min(backoff, config.max_interval_sec))
@@ -1,10 +1,17 @@
 """State persistence: load/save snapshot to .state/last.json."""
 
+import hashlib
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional: pip install soc-watch[fast]
+    orjson = None
+
 from .models import Snapshot
 
 logger = logging.getLogger(__name__)
@@ -12,22 +19,58 @@ logger = logging.getLogger(__name__)
 STATE_DIR = Path(".state")
 STATE_FILE = STATE_DIR / "last.json"
 
+# (st_mtime_ns, snapshot) per state file, as last read or written by this process
+_cache: dict[Path, tuple[int, Snapshot]] = {}
+
+
+def state_file(url: Optional[str] = None) -> Path:
+    """State file path: last.json, or a per-URL file when watching several URLs."""
+    if url is None:
+        return STATE_FILE
+    key = hashlib.blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
+    return STATE_DIR / f"last-{key}.json"
 
-def load_last_snapshot() -> Optional[Snapshot]:
+
+def load_last_snapshot(url: Optional[str] = None) -> Optional[Snapshot]:
     """Load last snapshot from disk. Returns None if not found or invalid."""
-    if not STATE_FILE.exists():
+    path = state_file(url)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
         return None
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     try:
-        with open(STATE_FILE, encoding="utf-8") as f:
-            d = json.load(f)
-        return Snapshot.from_dict(d)
-    except (json.JSONDecodeError, KeyError, ValueError) as e:
+        d = _loads(path.read_bytes())
+        snapshot = Snapshot.from_dict(d)
+    except (json.JSONDecodeError, KeyError, ValueError, TypeError, AttributeError) as e:
         logger.warning("Failed to load state: %s", e)
         return None
+    _cache[path] = (mtime, snapshot)
+    return snapshot
 
 
-def save_snapshot(snapshot: Snapshot) -> None:
-    """Persist snapshot to disk."""
+def save_snapshot(snapshot: Snapshot, url: Optional[str] = None) -> None:
+    """Persist snapshot to disk atomically (write temp file, then rename)."""
+    path = state_file(url)
+    tmp_path = path.with_name(path.name + ".tmp")
+    data = _dumps(snapshot.to_dict())
     STATE_DIR.mkdir(parents=True, exist_ok=True)
-    with open(STATE_FILE, "w", encoding="utf-8") as f:
-        json.dump(snapshot.to_dict(), f, indent=2)
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    _cache[path] = (path.stat().st_mtime_ns, snapshot)
+
+
+def _dumps(d: dict) -> bytes:
+    """Compact JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(d)
+    return json.dumps(d, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> dict:
+    """Parse JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
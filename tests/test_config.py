@@ -0,0 +1,30 @@
+"""Test config loading: env vars and CLI overrides."""
+
+from src.config import load_config
+
+
+def test_soc_url_splits_on_whitespace(monkeypatch):
+    monkeypatch.setenv("SOC_URL", " https://example.com/a\n https://example.com/b ")
+    config = load_config()
+    assert config.urls == ["https://example.com/a", "https://example.com/b"]
+    assert config.url == "https://example.com/a"
+
+
+def test_cli_url_overrides_soc_url(monkeypatch):
+    monkeypatch.setenv("SOC_URL", "https://example.com/a https://example.com/b")
+    config = load_config(url="https://example.com/c")
+    assert config.urls == ["https://example.com/c"]
+
+
+def test_positional_arguments_keep_their_order(monkeypatch):
+    monkeypatch.delenv("SOC_URL", raising=False)
+    config = load_config("https://example.com/a", 30)
+    assert config.urls == ["https://example.com/a"]
+    assert config.interval_sec == 30
+
+
+def test_soc_quiet_env(monkeypatch):
+    monkeypatch.setenv("SOC_QUIET", "yes")
+    assert load_config(url="https://example.com/a").quiet
+    monkeypatch.setenv("SOC_QUIET", "")
+    assert not load_config(url="https://example.com/a").quiet
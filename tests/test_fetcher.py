@@ -0,0 +1,39 @@
+"""Test fetcher: conditional requests and 304 handling."""
+
+from src import fetcher
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, content: bytes = b"", headers: dict = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def test_304_returns_not_modified_only_when_conditional(monkeypatch):
+    url = "https://example.com/a"
+    monkeypatch.setattr(fetcher, "_validators", {url: {"If-None-Match": '"v1"'}})
+    sent = []
+
+    def fake_get(u, headers=None, timeout=None):
+        sent.append(headers)
+        return FakeResponse(304)
+
+    monkeypatch.setattr(fetcher._SESSION, "get", fake_get)
+    assert fetcher.fetch_html(url, conditional=True) == (fetcher.NOT_MODIFIED, None)
+    assert fetcher.fetch_html(url) == (None, None)
+    assert sent == [{"If-None-Match": '"v1"'}, None]
+
+
+def test_200_returns_body_and_remembers_validators(monkeypatch):
+    url = "https://example.com/a"
+    monkeypatch.setattr(fetcher, "_validators", {})
+    resp = FakeResponse(200, b"<html></html>", {"ETag": '"v2"'})
+    monkeypatch.setattr(fetcher._SESSION, "get", lambda u, headers=None, timeout=None: resp)
+    body, digest = fetcher.fetch_html(url)
+    assert body == b"<html></html>"
+    assert digest is not None
+    assert fetcher._validators[url] == {"If-None-Match": '"v2"'}
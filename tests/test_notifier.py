@@ -0,0 +1,31 @@
+"""Test notifier interface and console output."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.models import Event, EventType, Snapshot
+from src.notifier import ConsoleNotifier, Notifier
+
+
+def test_console_messages_include_url(capsys):
+    now = datetime.now(timezone.utc)
+    snapshot = Snapshot(timestamp=now, sections={"Lec 1": "CLOSED"})
+    notifier = ConsoleNotifier()
+    for event_type in EventType:
+        notifier.notify(Event(
+            type=event_type,
+            timestamp=now,
+            curr_snapshot=snapshot,
+            diff=["Lec 1"],
+            url="https://example.com/a",
+        ))
+        assert "https://example.com/a" in capsys.readouterr().out
+
+
+def test_notifier_without_notify_cannot_be_constructed():
+    class Incomplete(Notifier):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
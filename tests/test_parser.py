@@ -2,39 +2,81 @@
 
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-from src.parser import parse
+from src.parser import _extract_status_from_text, _normalize_value, parse
 from src.models import Status
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
-def _load_fixture(name: str) -> str:
-    with open(FIXTURES / name, encoding="utf-8") as f:
-        return f.read()
+@pytest.fixture(scope="session")
+def fixture_loader():
+    """Read each fixture file at most once per test session."""
+    cache: dict[str, str] = {}
 
+    def _load(name: str) -> str:
+        if name not in cache:
+            cache[name] = (FIXTURES / name).read_text(encoding="utf-8")
+        return cache[name]
 
-def test_parse_full_closed():
-    html = _load_fixture("full_closed.html")
-    snapshot = parse(html)
+    return _load
+
+
+@pytest.fixture(scope="session")
+def parsed_fixture(fixture_loader):
+    """Parse each fixture at most once per test session."""
+    cache = {}
+
+    def _parse(name: str):
+        if name not in cache:
+            cache[name] = parse(fixture_loader(name))
+        return cache[name]
+
+    return _parse
+
+
+def test_parse_full_closed(parsed_fixture):
+    snapshot = parsed_fixture("full_closed.html")
     assert snapshot is not None
     assert snapshot.sections["Lec 1"] == Status.CLOSED.value
     assert snapshot.sections["Dis 1A"] == Status.CLOSED.value
 
 
-def test_parse_open():
-    html = _load_fixture("open.html")
-    snapshot = parse(html)
+def test_parse_open(parsed_fixture):
+    snapshot = parsed_fixture("open.html")
     assert snapshot is not None
     assert snapshot.sections["Lec 1"] == Status.OPEN.value
     assert snapshot.sections["Dis 1A"] == Status.OPEN.value
 
 
-def test_parse_waitlisted():
-    html = _load_fixture("waitlisted.html")
-    snapshot = parse(html)
+def test_parse_waitlisted(parsed_fixture):
+    snapshot = parsed_fixture("waitlisted.html")
     assert snapshot is not None
     assert snapshot.sections["Lec 1"] == Status.WAITLISTED.value
     assert snapshot.sections["Dis 1A"] == Status.WAITLISTED.value
+
+
+def test_parse_bytes(fixture_loader):
+    html = fixture_loader("open.html").encode("utf-8")
+    snapshot = parse(html)
+    assert snapshot is not None
+    assert snapshot.sections["Lec 1"] == Status.OPEN.value
+
+
+def test_parse_page_without_rows():
+    snapshot = parse(b"<html><body><h1>Service unavailable</h1></body></html>")
+    assert snapshot is not None
+    assert snapshot.sections == {}
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Closed by Dept Computer Science (0 capacity, 0 enrolled)", Status.CLOSED),
+        ("Closed Class Full (25) 0 of 10 Waitlisted", Status.CLOSED),
+        ("Waitlist Class Full (30) 5 of 10 Taken", Status.WAITLISTED),
+    ],
+)
+def test_status_text_uses_leftmost_phrase(text, expected):
+    assert _normalize_value(_extract_status_from_text(text)) == expected.value
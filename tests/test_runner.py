@@ -0,0 +1,307 @@
+"""Test runner: opt-in poll backoff, batching events across URLs, async state writes."""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from src import runner, state
+from src.config import Config
+from src.fetcher import NOT_MODIFIED
+from src.models import Event, EventType, Snapshot
+from src.notifier import ConsoleNotifier, Notifier, SlackNotifier
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def runner_env(tmp_path, monkeypatch):
+    """Fresh runner caches and a temporary state directory; returns a fetch stub setter."""
+    monkeypatch.setattr(state, "STATE_DIR", tmp_path)
+    monkeypatch.setattr(state, "STATE_FILE", tmp_path / "last.json")
+    monkeypatch.setattr(state, "_cache", {})
+    for name in ("_last_hash", "_unchanged_streaks", "_pending_saves"):
+        monkeypatch.setattr(runner, name, {})
+    monkeypatch.setattr(runner, "_dirty_saves", set())
+    monkeypatch.setattr(runner, "_parse_cache", runner.OrderedDict())
+
+    pages: dict[str, tuple] = {}
+    monkeypatch.setattr(runner, "fetch_html", lambda url, conditional=False: pages[url])
+    yield pages
+    runner._flush_saves()
+
+
+def _page(name: str, body_hash: bytes) -> tuple[bytes, bytes]:
+    return (FIXTURES / name).read_bytes(), body_hash
+
+
+def test_no_backoff_without_max_interval(runner_env):
+    config = Config(url="https://example.com/a", interval_sec=60, quiet=True)
+    runner._unchanged_streaks[config.url] = 3
+    assert runner._next_interval(config) == 60
+
+
+def test_backoff_grows_while_unchanged_and_resets_on_change(runner_env):
+    url = "https://example.com/a"
+    config = Config(url=url, interval_sec=60, max_interval_sec=300, quiet=True)
+
+    runner_env[url] = _page("open.html", b"h1")
+    _, prev = runner.run_once(config, url, None, [])
+    assert runner._next_interval(config) == 60
+
+    _, prev = runner.run_once(config, url, prev, [])
+    assert runner._next_interval(config) == 120
+    _, prev = runner.run_once(config, url, prev, [])
+    _, prev = runner.run_once(config, url, prev, [])
+    assert runner._next_interval(config) == 300  # capped at max_interval_sec
+
+    runner_env[url] = _page("full_closed.html", b"h2")
+    _, prev = runner.run_once(config, url, prev, [])
+    assert runner._unchanged_streaks[url] == 0
+    assert runner._next_interval(config) == 60
+
+
+def test_not_modified_without_snapshot_is_a_failed_poll(runner_env, caplog):
+    url = "https://example.com/a"
+    config = Config(url=url, quiet=True)
+    runner_env[url] = (NOT_MODIFIED, None)
+    assert runner.run_once(config, url, None, []) == (False, None)
+    assert url in caplog.text
+
+
+class RecordingSlackNotifier(SlackNotifier):
+    """SlackNotifier that records payloads instead of posting them."""
+
+    def __init__(self):
+        super().__init__("https://hooks.example.com")
+        self.posted: list[str] = []
+
+    def _post(self, payload: dict) -> None:
+        self.posted.append(payload["text"])
+
+
+def test_run_all_batches_events_across_urls(runner_env):
+    urls = ["https://example.com/a", "https://example.com/b"]
+    config = Config(url=urls[0], urls=urls, quiet=True)
+    slack = RecordingSlackNotifier()
+
+    for u in urls:
+        runner_env[u] = _page("full_closed.html", u.encode())
+    prevs = runner.run_all(config, {}, [slack])
+    slack.posted.clear()
+
+    for u in urls:
+        runner_env[u] = _page("open.html", u.encode() + b"-open")
+    runner.run_all(config, prevs, [slack])
+
+    batch, *statuses = slack.posted
+    assert batch.count("CLASS AVAILABLE") == 2
+    assert all(u in batch for u in urls)
+    assert len(statuses) == 2
+
+
+def test_run_all_tracks_state_per_url(runner_env, tmp_path):
+    urls = ["https://example.com/a", "https://example.com/b"]
+    config = Config(url=urls[0], urls=urls, quiet=True)
+    runner_env[urls[0]] = _page("open.html", b"a1")
+    runner_env[urls[1]] = _page("full_closed.html", b"b1")
+    prevs = runner.run_all(config, {}, [])
+
+    runner_env[urls[1]] = _page("waitlisted.html", b"b2")
+    prevs = runner.run_all(config, prevs, [])
+    assert runner._unchanged_streaks == {urls[0]: 1, urls[1]: 0}
+    assert runner._last_hash == {urls[0]: b"a1", urls[1]: b"b2"}
+
+    runner._flush_saves()
+    state._cache.clear()
+    assert not (tmp_path / "last.json").exists()
+    for u in urls:
+        assert state.state_file(u).exists()
+        assert state.load_last_snapshot(u).sections == prevs[u].sections
+
+
+def test_superseded_pending_save_is_cancelled(runner_env, monkeypatch, tmp_path):
+    writer = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(runner, "_writer", writer)
+    release = threading.Event()
+    writer.submit(release.wait)  # hold the worker so queued saves stay pending
+
+    first = Snapshot(timestamp=datetime.now(timezone.utc), sections={"Lec 1": "CLOSED"})
+    second = Snapshot(timestamp=datetime.now(timezone.utc), sections={"Lec 1": "OPEN"})
+    runner._save_async(first)
+    pending = runner._pending_saves[None]
+    runner._save_async(second)
+    assert pending.cancelled()
+
+    release.set()
+    runner._flush_saves()
+    writer.shutdown()
+    state._cache.clear()
+    assert state.load_last_snapshot().sections == {"Lec 1": "OPEN"}
+
+
+def test_failed_save_is_logged_not_raised(runner_env, monkeypatch, caplog):
+    def broken_save(snapshot, url=None):
+        raise TypeError("not serializable")
+
+    monkeypatch.setattr(runner, "save_snapshot", broken_save)
+    runner._save_async(Snapshot(timestamp=datetime.now(timezone.utc), sections={}))
+    runner._flush_saves()
+    assert "Failed to save state" in caplog.text
+
+
+def test_unchanged_poll_retries_failed_save(runner_env, monkeypatch, tmp_path):
+    url = "https://example.com/a"
+    config = Config(url=url, quiet=True)
+    runner_env[url] = _page("full_closed.html", b"h1")
+    _, prev = runner.run_once(config, url, None, [])
+    runner._flush_saves()
+
+    real_save = runner.save_snapshot
+    failures = [OSError("disk full")]
+
+    def flaky_save(snapshot, key=None):
+        if failures:
+            raise failures.pop()
+        real_save(snapshot, key)
+
+    monkeypatch.setattr(runner, "save_snapshot", flaky_save)
+    runner_env[url] = _page("open.html", b"h2")
+    _, prev = runner.run_once(config, url, prev, [])
+    runner._flush_saves()
+    assert None in runner._dirty_saves
+
+    for _ in range(3):
+        _, prev = runner.run_once(config, url, prev, [])
+        runner._flush_saves()
+    assert not runner._dirty_saves
+    state._cache.clear()
+    assert state.load_last_snapshot().sections == prev.sections
+
+
+def test_parse_cache_reuses_pages_and_evicts_oldest(runner_env, monkeypatch):
+    calls = []
+    real_parse = runner.parse
+
+    def counting_parse(html, now=None):
+        calls.append(html)
+        return real_parse(html, now=now)
+
+    monkeypatch.setattr(runner, "parse", counting_parse)
+    page_a, _ = _page("open.html", b"")
+    page_b, _ = _page("full_closed.html", b"")
+    t0, t1, t2 = (datetime(2024, 1, 1, h, tzinfo=timezone.utc) for h in range(3))
+
+    first = runner._parse_cached(page_a, b"A", t0)
+    runner._parse_cached(page_b, b"B", t1)
+    again = runner._parse_cached(page_a, b"A", t2)
+    assert len(calls) == 2
+    assert again.timestamp == t2 and first.timestamp == t0
+    assert again.sections == first.sections
+
+    for i in range(runner.PARSE_CACHE_SIZE):
+        runner._parse_cached(page_b, f"fill{i}".encode(), t0)
+    assert len(runner._parse_cache) == runner.PARSE_CACHE_SIZE
+    assert b"A" not in runner._parse_cache
+    calls.clear()
+    runner._parse_cached(page_a, b"A", t0)
+    assert len(calls) == 1
+
+
+def test_run_loop_sleeps_to_deadline_and_restarts_after_overrun(runner_env, monkeypatch):
+    clock = [1000.0]
+    sleeps = []
+    poll_starts = []
+    durations = [5, 70, 3]
+
+    class FakeTime:
+        @staticmethod
+        def monotonic():
+            return clock[0]
+
+        @staticmethod
+        def sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+    def fake_poll(config, prevs, notifiers):
+        poll_starts.append(clock[0])
+        if not durations:
+            raise KeyboardInterrupt
+        clock[0] += durations.pop(0)
+        return prevs
+
+    monkeypatch.setattr(runner, "time", FakeTime)
+    monkeypatch.setattr(runner, "_poll", fake_poll)
+    config = Config(url="https://example.com/a", interval_sec=60, quiet=True)
+    with pytest.raises(KeyboardInterrupt):
+        runner.run_loop(config)
+
+    # 60 - 5; the 70s poll overran, so the next poll starts at once and the schedule restarts
+    assert sleeps == [55, 57]
+    assert poll_starts == [1000, 1060, 1130, 1190]
+
+
+class RecordingNotifier(Notifier):
+    """Records calls; notify_batch waits on a shared barrier to prove concurrent dispatch."""
+
+    def __init__(self, barrier: threading.Barrier):
+        self.barrier = barrier
+        self.calls: list[tuple] = []
+
+    def notify(self, event) -> None:
+        self.calls.append(("event", event.url))
+
+    def notify_batch(self, events) -> None:
+        self.barrier.wait(timeout=5)
+        super().notify_batch(events)
+
+    def notify_status(self, snapshot, url=None) -> None:
+        time.sleep(0.05)
+        self.calls.append(("status", url))
+
+
+def test_dispatch_runs_notifiers_concurrently_and_in_order(runner_env):
+    barrier = threading.Barrier(2)
+    notifiers = [RecordingNotifier(barrier), RecordingNotifier(barrier)]
+    now = datetime.now(timezone.utc)
+    snapshot = Snapshot(timestamp=now, sections={"Lec 1": "OPEN"})
+    events = [
+        Event(type=EventType.BECAME_AVAILABLE, timestamp=now, curr_snapshot=snapshot, url=u)
+        for u in ("a", "b")
+    ]
+
+    runner._dispatch_notifications(notifiers, events, [(snapshot, "a"), (snapshot, "b")])
+
+    expected = [("event", "a"), ("event", "b"), ("status", "a"), ("status", "b")]
+    for n in notifiers:
+        assert n.calls == expected  # complete on return, events before statuses
+
+
+@pytest.mark.parametrize("quiet", [False, True])
+def test_quiet_hides_status_line_but_not_events(runner_env, capsys, quiet):
+    url = "https://example.com/a"
+    config = Config(url=url, quiet=quiet)
+    runner_env[url] = _page("full_closed.html", b"h1")
+    _, prev = runner.run_once(config, url, None, [ConsoleNotifier()])
+    runner_env[url] = _page("open.html", b"h2")
+    runner.run_once(config, url, prev, [ConsoleNotifier()])
+
+    out = capsys.readouterr().out
+    assert "CLASS AVAILABLE" in out
+    assert ("] Lec 1: " in out) is not quiet  # status line: [timestamp] Lec 1: ...
+
+
+def test_verbose_status_line_not_built_when_info_disabled(runner_env, monkeypatch, caplog):
+    def fail_format(snapshot, url=None):
+        raise AssertionError("status line built but not emitted")
+
+    monkeypatch.setattr(runner, "_format_status_line", fail_format)
+    caplog.set_level(logging.WARNING, logger=runner.logger.name)
+    url = "https://example.com/a"
+    runner_env[url] = _page("open.html", b"h1")
+    assert runner.run_once(Config(url=url, verbose=True), url, None, [])[0]
@@ -0,0 +1,101 @@
+"""Test state persistence: load/save round-trip and malformed state files."""
+
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from src import state
+from src.models import Snapshot
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    """Point state persistence at a temporary directory."""
+    monkeypatch.setattr(state, "STATE_DIR", tmp_path)
+    monkeypatch.setattr(state, "STATE_FILE", tmp_path / "last.json")
+    monkeypatch.setattr(state, "_cache", {})
+    return tmp_path
+
+
+def _snapshot(status: str = "OPEN") -> Snapshot:
+    return Snapshot(
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        sections={"Lec 1": status, "Dis 1A": "CLOSED"},
+        meta={"term": "24W"},
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_save_load_round_trip(state_dir, monkeypatch, use_orjson):
+    if use_orjson:
+        monkeypatch.setattr(state, "orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(state, "orjson", None)
+    snapshot = _snapshot()
+    state.save_snapshot(snapshot)
+    state._cache.clear()  # force a read from disk
+    assert state.load_last_snapshot() == snapshot
+    assert json.loads((state_dir / "last.json").read_bytes()) == snapshot.to_dict()
+
+
+def test_save_replaces_atomically(state_dir, monkeypatch):
+    state.save_snapshot(_snapshot("CLOSED"))
+    assert [p.name for p in state_dir.iterdir()] == ["last.json"]  # temp file renamed away
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(state.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        state.save_snapshot(_snapshot("OPEN"))
+    state._cache.clear()
+    assert state.load_last_snapshot().sections["Lec 1"] == "CLOSED"  # old file intact
+
+
+def test_non_string_status_loads_without_error(state_dir):
+    (state_dir / "last.json").write_text(
+        '{"timestamp": "2024-01-01T00:00:00+00:00", "sections": {"Lec 1": null}}'
+    )
+    snapshot = state.load_last_snapshot()
+    assert snapshot is not None
+    assert snapshot.sections == {"Lec 1": None}
+
+
+def test_malformed_sections_returns_none(state_dir):
+    (state_dir / "last.json").write_text(
+        '{"timestamp": "2024-01-01T00:00:00+00:00", "sections": ["Lec 1"]}'
+    )
+    assert state.load_last_snapshot() is None
+
+
+def test_state_file_is_per_url(state_dir):
+    assert state.state_file() == state_dir / "last.json"
+    a = state.state_file("https://example.com/a")
+    b = state.state_file("https://example.com/b")
+    assert a != b
+    assert a.parent == state_dir and a.name.startswith("last-")
+    assert state.state_file("https://example.com/a") == a
+
+
+def test_load_uses_cache_until_file_changes(state_dir, monkeypatch):
+    snapshot = _snapshot("CLOSED")
+    state.save_snapshot(snapshot)
+    path = state_dir / "last.json"
+
+    def no_read(self):
+        raise AssertionError("state file re-read while its mtime was unchanged")
+
+    with monkeypatch.context() as m:
+        m.setattr(type(path), "read_bytes", no_read)
+        assert state.load_last_snapshot() is snapshot
+        assert state.load_last_snapshot() is snapshot
+
+    # External rewrite with a new mtime is picked up
+    mtime = path.stat().st_mtime_ns
+    path.write_bytes(state._dumps(_snapshot("OPEN").to_dict()))
+    os.utime(path, ns=(mtime + 1_000_000_000, mtime + 1_000_000_000))
+    reloaded = state.load_last_snapshot()
+    assert reloaded is not snapshot
+    assert reloaded.sections["Lec 1"] == "OPEN"